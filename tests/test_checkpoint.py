@@ -0,0 +1,30 @@
+import pytest
+
+from creeper import read_checkpoint, write_checkpoint
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "checkpoint.bin")
+    sections = {
+        "visited_urls": ["https://example.com/", "https://example.com/café", "https://example.com/a\x00b"],
+        "visited_hashes": ["", "ab" * 32, "cd" * 32],
+        "unvisited": [],
+    }
+    write_checkpoint(path, sections)
+    assert read_checkpoint(path) == sections
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "checkpoint.bin"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        read_checkpoint(str(path))
+
+
+def test_rejects_truncated_section(tmp_path):
+    path = tmp_path / "checkpoint.bin"
+    write_checkpoint(str(path), {"unvisited": ["https://example.com/a", "https://example.com/b"]})
+    data = path.read_bytes()
+    path.write_bytes(data[:-4])
+    with pytest.raises(ValueError):
+        read_checkpoint(str(path))
@@ -0,0 +1,31 @@
+import codecs
+
+from creeper import detect_encoding
+
+
+def test_header_charset_wins():
+    assert detect_encoding(b"<p>caf\xe9</p>", "text/html; charset=ISO-8859-1") == "iso8859-1"
+
+
+def test_bom():
+    assert detect_encoding(codecs.BOM_UTF8 + b"<p>x</p>") == "utf-8-sig"
+    assert detect_encoding(codecs.BOM_UTF16_LE + "x".encode("utf-16-le")) == "utf-16"
+
+
+def test_meta_charset():
+    body = b'<html><head><meta charset="windows-1252"></head><body>\x93hi\x94</body></html>'
+    assert detect_encoding(body, "text/html") == "cp1252"
+
+
+def test_unknown_declared_charset_is_skipped():
+    assert detect_encoding("café".encode("utf-8"), "text/html; charset=bogus") == "utf-8"
+
+
+def test_utf8_fallback():
+    assert detect_encoding("naïve — café".encode("utf-8")) == "utf-8"
+    assert detect_encoding(b"") == "utf-8"
+
+
+def test_bom_overrides_conflicting_header():
+    body = codecs.BOM_UTF8 + "café".encode("utf-8")
+    assert detect_encoding(body, "text/html; charset=ISO-8859-1") == "utf-8-sig"
@@ -0,0 +1,27 @@
+import os
+
+from creeper import EXTRACTED_FILENAME, TextExtractor
+
+
+def extract(tmp_path, files):
+    records = []
+    extractor = TextExtractor(records.append, workers=1,
+                              seen_path=os.path.join(str(tmp_path), EXTRACTED_FILENAME))
+    for name, file_hash in files:
+        path = os.path.join(str(tmp_path), name)
+        extractor.submit(path, "https://example.com/" + name, "https://example.com/", file_hash, "text/plain")
+    extractor.close()
+    return records
+
+
+def test_extracted_hashes_survive_a_restart(tmp_path):
+    for name in ("a.txt", "b.txt"):
+        with open(os.path.join(str(tmp_path), name), "w") as f:
+            f.write(f"text of {name}")
+    first = extract(tmp_path, [("a.txt", "hash-a"), ("a.txt", "hash-a")])
+    assert [r["title"] for r in first] == ["a.txt"]
+
+    second = extract(tmp_path, [("a.txt", "hash-a"), ("b.txt", "hash-b")])
+    assert [r["title"] for r in second] == ["b.txt"]
+    with open(os.path.join(str(tmp_path), EXTRACTED_FILENAME)) as f:
+        assert f.read().split() == ["hash-a", "hash-b"]
@@ -0,0 +1,86 @@
+import json
+import os
+
+from creeper import (INDEX_DOCS, INDEX_MANIFEST, TextIndexer, decode_postings, encode_postings,
+                     search_index)
+
+
+def test_postings_round_trip():
+    postings = [(0, 1), (5, 3), (130, 1), (100000, 7)]
+    assert decode_postings(encode_postings(postings)) == postings
+
+
+def test_merge_of_many_segments_keeps_postings_ordered(tmp_path):
+    indexer = TextIndexer(str(tmp_path), flush_docs=200, merge_factor=8)
+    for i in range(1600):
+        words = "common" if i % 2 else "common rare"
+        indexer.add(f"https://example.com/{i}", f"{words} page{i}")
+    indexer.close()
+
+    with open(os.path.join(str(tmp_path), INDEX_MANIFEST)) as f:
+        manifest = json.load(f)
+    assert manifest["docs"] == 1600
+    assert len(manifest["segments"]) < 8
+
+    results = search_index(str(tmp_path), "rare", limit=2000)
+    assert len(results) == 800
+    assert {url for _, url in results} == {f"https://example.com/{i}" for i in range(0, 1600, 2)}
+    assert search_index(str(tmp_path), "page1599")[0][1] == "https://example.com/1599"
+
+
+def test_reindexed_url_supersedes_older_document(tmp_path):
+    indexer = TextIndexer(str(tmp_path), flush_docs=2)
+    indexer.add("https://example.com/a", "old words")
+    indexer.add("https://example.com/b", "other")
+    indexer.add("https://example.com/a", "new words")
+    indexer.close()
+    assert search_index(str(tmp_path), "old") == []
+    assert [url for _, url in search_index(str(tmp_path), "new")] == ["https://example.com/a"]
+
+
+def test_merges_are_tiered(tmp_path):
+    indexer = TextIndexer(str(tmp_path), flush_docs=10, merge_factor=2)
+    for i in range(70):
+        indexer.add(f"https://example.com/{i}", f"word{i} shared")
+    indexer.close()
+
+    with open(os.path.join(str(tmp_path), INDEX_MANIFEST)) as f:
+        manifest = json.load(f)
+    # 70 documents: one segment each of 40, 20 and 10, oldest first.
+    assert manifest["sizes"] == [40, 20, 10]
+    assert len(search_index(str(tmp_path), "shared", limit=100)) == 70
+    assert search_index(str(tmp_path), "word35")[0][1] == "https://example.com/35"
+
+
+def test_reopen_drops_docs_lines_the_manifest_does_not_cover(tmp_path):
+    indexer = TextIndexer(str(tmp_path), flush_docs=1)
+    indexer.add("https://example.com/a", "alpha")
+    indexer.close()
+    # A crash between appending docs.txt and replacing the manifest.
+    with open(os.path.join(str(tmp_path), INDEX_DOCS), "a") as f:
+        f.write("https://example.com/lost\t1\n")
+
+    indexer = TextIndexer(str(tmp_path), flush_docs=1)
+    indexer.add("https://example.com/b", "beta")
+    indexer.close()
+    assert [url for _, url in search_index(str(tmp_path), "beta")] == ["https://example.com/b"]
+    assert [url for _, url in search_index(str(tmp_path), "alpha")] == ["https://example.com/a"]
+
+
+def test_reopen_truncates_by_line_count_without_docs_bytes(tmp_path):
+    indexer = TextIndexer(str(tmp_path), flush_docs=1)
+    indexer.add("https://example.com/a", "alpha")
+    indexer.close()
+    manifest_path = os.path.join(str(tmp_path), INDEX_MANIFEST)
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    del manifest["docs_bytes"]
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+    with open(os.path.join(str(tmp_path), INDEX_DOCS), "a") as f:
+        f.write("https://example.com/lost\t1\n")
+
+    indexer = TextIndexer(str(tmp_path), flush_docs=1)
+    indexer.add("https://example.com/b", "beta")
+    indexer.close()
+    assert [url for _, url in search_index(str(tmp_path), "beta")] == ["https://example.com/b"]
@@ -0,0 +1,32 @@
+import logging
+
+from creeper import RateLimitFilter
+
+
+def record(msg, *args, level=logging.INFO):
+    return logging.LogRecord("creeper", level, __file__, 1, msg, args, None)
+
+
+def test_template_is_limited_across_arguments():
+    limiter = RateLimitFilter(rate=0.0001, burst=3)
+    passed = [limiter.filter(record("Loaded robots.txt for %s", f"host{i}")) for i in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+    assert limiter.filter(record("Blocked %s", "x", level=logging.WARNING))
+
+
+def test_suppressed_count_is_reported():
+    limiter = RateLimitFilter(rate=0.0001, burst=1)
+    limiter.filter(record("Crawling: %s", "a"))
+    limiter.filter(record("Crawling: %s", "b"))
+    limiter.buckets["Crawling: %s"][0] = 1
+    next_record = record("Crawling: %s", "c")
+    assert limiter.filter(next_record)
+    assert next_record.suppressed == 1
+
+
+def test_buckets_are_capped():
+    limiter = RateLimitFilter(rate=1, burst=1, max_buckets=5)
+    for i in range(50):
+        limiter.filter(record(f"message {i}"))
+    assert len(limiter.buckets) == 5
+    assert "message 49" in limiter.buckets
@@ -0,0 +1,100 @@
+import http.server
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from creeper import PROXY_FAIL_THRESHOLD, ProxiedSession, ProxyPool
+
+
+class ProxyHandler(http.server.BaseHTTPRequestHandler):
+    # Stand-in forward proxy: answers every absolute-URI request itself.
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def live_proxy():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ProxyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def dead_proxy():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f"http://127.0.0.1:{port}"
+
+
+def test_sticky_pins_hosts_and_spreads_them():
+    pool = ProxyPool(["http://p1", "http://p2"], mode="sticky", max_inflight=4)
+    first = pool.acquire("a.example")
+    assert pool.acquire("a.example") is first
+    assert pool.acquire("b.example") is not first
+
+
+def test_round_robin_respects_concurrency():
+    pool = ProxyPool(["http://p1", "http://p2"], mode="round-robin", max_inflight=1)
+    a = pool.acquire("x")
+    b = pool.acquire("x")
+    assert {a.url, b.url} == {"http://p1", "http://p2"}
+    pool.release(a, ok=True)
+    assert pool.acquire("x") is a
+
+
+def test_eject_and_readmit_after_cooldown():
+    pool = ProxyPool(["http://p1", "http://p2"], mode="round-robin")
+    bad, good = pool.proxies
+    for _ in range(PROXY_FAIL_THRESHOLD):
+        bad.inflight += 1
+        pool.release(bad, ok=False)
+    assert bad.ejected_until > time.time()
+    for _ in range(3):
+        proxy = pool.acquire("x")
+        assert proxy is good
+        pool.release(proxy, ok=True)
+    bad.ejected_until = time.time() - 1
+    assert [pool.acquire("x"), pool.acquire("x")] == [bad, good]
+
+
+def test_no_healthy_proxy_raises():
+    pool = ProxyPool(["http://p1"])
+    pool.eject(pool.proxies[0])
+    with pytest.raises(requests.exceptions.ProxyError):
+        pool.acquire("x")
+
+
+def test_health_check_readmits_live_and_ejects_dead(live_proxy, dead_proxy):
+    pool = ProxyPool([live_proxy, dead_proxy], check_url="http://check.example/")
+    for proxy in pool.proxies:
+        pool.eject(proxy)
+        proxy.ejected_until = time.time() - 1
+    pool.health_check(requests.Session())
+    live, dead = pool.proxies
+    assert live.ejected_until == 0
+    assert dead.ejected_until > time.time()
+
+
+def test_slot_is_held_until_the_streamed_response_is_closed(live_proxy):
+    pool = ProxyPool([live_proxy], max_inflight=1)
+    session = ProxiedSession(requests.Session(), pool)
+    resp = session.get("http://target.example/page", stream=True)
+    assert pool.proxies[0].inflight == 1
+    assert resp.content == b"http://target.example/page"
+    resp.close()
+    assert pool.proxies[0].inflight == 0
+    resp.close()
+    assert pool.proxies[0].inflight == 0
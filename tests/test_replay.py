@@ -0,0 +1,72 @@
+import http.server
+import threading
+
+import pytest
+
+from creeper import WebCrawler
+
+PAGES = {
+    "/": '<html><title>home</title><a href="/a.html">a</a>'
+         + "".join(f'<a href="/data/{i}.json">{i}</a>' for i in range(8)) + "</html>",
+    "/a.html": '<html><title>a</title><a href="/">home</a><a href="/missing.html">m</a></html>',
+}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path in PAGES:
+            body, content_type = PAGES[self.path].encode(), "text/html"
+        elif self.path.endswith(".json"):
+            body, content_type = b'{"x": 1}', "application/json"
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def site():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+def crawl(config):
+    crawler = WebCrawler(config)
+    try:
+        assert crawler.start()
+    finally:
+        crawler.close()
+    return crawler
+
+
+def test_replay_reproduces_live_run(site, tmp_path):
+    live = crawl({"seed": site, "output_dir": str(tmp_path / "live"), "warc": True})
+    assert sum(1 for status in live.visited.values() if status == "skipped") == 8
+
+    replayed = crawl({"seed": site, "output_dir": str(tmp_path / "replay"), "replay": str(tmp_path / "live")})
+    assert replayed.visited == live.visited
+    assert replayed.failures.open_breakers() == 0
+
+
+def test_unarchived_urls_fail_without_tripping_the_breaker(site, tmp_path):
+    crawl({"seed": site, "output_dir": str(tmp_path / "live"), "warc": True})
+    cdx = tmp_path / "live" / "warc" / "index.cdx"
+    cdx.write_text("".join(line for line in cdx.read_text().splitlines(True) if ".json" not in line))
+
+    replayed = crawl({"seed": site, "output_dir": str(tmp_path / "replay"), "replay": str(tmp_path / "live")})
+    missing = [url for url, status in replayed.visited.items() if status == "failed:not-archived"]
+    assert len(missing) == 8
+    assert replayed.visited[site + "a.html"] not in ("failed:not-archived", "failed:host-down")
+    assert replayed.failures.open_breakers() == 0
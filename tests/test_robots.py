@@ -0,0 +1,59 @@
+from creeper import RobotsRules
+
+
+ROBOTS = """
+User-agent: *
+Disallow: /private/
+Allow: /private/public
+
+User-agent: creeper/1.0
+Disallow: /no-creeper
+Crawl-delay: 2
+
+User-agent: c
+User-agent: e
+Disallow: /
+
+User-agent: creeperbot
+Disallow: /
+
+Sitemap: https://example.com/sitemap.xml
+"""
+
+
+def test_group_matches_product_token():
+    rules = RobotsRules.parse(ROBOTS, "creeper")
+    assert not rules.allowed("/no-creeper")
+    assert rules.allowed("/anything")
+    assert rules.crawl_delay == 2
+    assert rules.sitemaps == ["https://example.com/sitemap.xml"]
+
+
+def test_agent_match_is_case_insensitive():
+    rules = RobotsRules.parse("User-agent: CREEPER\nDisallow: /x\n", "creeper")
+    assert not rules.allowed("/x")
+
+
+def test_falls_back_to_star_group():
+    rules = RobotsRules.parse(ROBOTS, "otherbot")
+    assert not rules.allowed("/private/x")
+    assert rules.allowed("/private/public")
+    assert rules.allowed("/no-creeper")
+
+
+def test_longest_match_and_wildcards():
+    rules = RobotsRules.parse("User-agent: *\nDisallow: /*.pdf$\nDisallow: /a\nAllow: /a/b\n", "creeper")
+    assert not rules.allowed("/docs/file.pdf")
+    assert rules.allowed("/docs/file.pdf?x=1")
+    assert not rules.allowed("/a/c")
+    assert rules.allowed("/a/b/c")
+
+
+def test_empty_disallow_allows_everything():
+    rules = RobotsRules.parse("User-agent: *\nDisallow:\n", "creeper")
+    assert rules.allowed("/")
+
+
+def test_unavailable_disallows_everything():
+    assert not RobotsRules(unavailable=True).allowed("/")
+    assert RobotsRules().allowed("/")
@@ -0,0 +1,49 @@
+import logging
+
+from creeper import UrlRules
+
+
+def load(tmp_path, text):
+    path = tmp_path / "rules.txt"
+    path.write_text(text)
+    return UrlRules.load(str(path))
+
+
+def test_glob_is_anchored(tmp_path):
+    rules = load(tmp_path, "+ glob:https://example.com/*\n")
+    assert rules.allows("https://example.com/x")
+    assert not rules.allows("https://evil.com/go?u=https://example.com/x")
+
+
+def test_excludes_win_over_includes(tmp_path):
+    rules = load(tmp_path, "+ host:*.example.com\n- path:/search\n- glob:*/print/*\n- re:[?&](?:sort|order)=\n")
+    assert rules.allows("https://www.example.com/docs")
+    assert not rules.allows("https://www.example.com/search?q=a")
+    assert not rules.allows("https://www.example.com/a/print/b")
+    assert not rules.allows("https://www.example.com/list?page=2&sort=asc")
+    assert not rules.allows("https://other.org/docs")
+
+
+def test_host_glob_and_url_prefix(tmp_path):
+    rules = load(tmp_path, "+ host:docs.*.org\n+ https://example.com/docs/\n")
+    assert rules.allows("https://docs.python.org/3/")
+    assert rules.allows("https://example.com/docs/a")
+    assert not rules.allows("https://example.com/blog/")
+    assert not rules.allows("https://evil.com/?docs.python.org")
+
+
+def test_regexes_that_cannot_be_combined(tmp_path):
+    rules = load(tmp_path, "- re:(?i)\\.PDF$\n- re:/(\\w+)/\\1/\n- re:(?P<x>print)\n- re:(?P<x>amp)/\n")
+    assert not rules.allows("https://example.com/report.pdf")
+    assert not rules.allows("https://example.com/a/a/b")
+    assert not rules.allows("https://example.com/print")
+    assert not rules.allows("https://example.com/amp/x")
+    assert rules.allows("https://example.com/a/b/c")
+
+
+def test_invalid_rule_is_reported_and_skipped(tmp_path, caplog):
+    with caplog.at_level(logging.ERROR, logger="creeper"):
+        rules = load(tmp_path, "- re:[unclosed\n- path:/private\n")
+    assert "line 1" in caplog.text
+    assert not rules.allows("https://example.com/private/x")
+    assert rules.allows("https://example.com/public")
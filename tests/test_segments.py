@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from creeper import SegmentStore, zstandard
+
+
+@pytest.mark.parametrize("codec", ["gzip", pytest.param("zstd", marks=pytest.mark.skipif(
+    zstandard is None, reason="zstandard not installed"))])
+def test_get_rotate_and_reopen(tmp_path, codec):
+    path = str(tmp_path / "segments")
+    store = SegmentStore(path, codec, segment_size=4096)
+    records = [{"url": f"https://example.com/{i}", "text": os.urandom(400).hex()} for i in range(20)]
+    for record in records:
+        store.append(record)
+    assert len(store.segments) > 1
+    assert store.get("https://example.com/7") == records[7]
+    assert store.get("https://example.com/missing") is None
+    store.close()
+
+    reopened = SegmentStore(path, codec, segment_size=4096)
+    assert reopened.get("https://example.com/19") == records[19]
+    assert list(reopened.iter_records()) == records
+    updated = {"url": "https://example.com/3", "text": "newer"}
+    reopened.append(updated)
+    assert reopened.get("https://example.com/3") == updated
+    reopened.close()
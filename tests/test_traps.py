@@ -0,0 +1,29 @@
+from creeper import TrapDetector
+
+
+def test_template_normalizes_ids_digits_and_query_values():
+    assert TrapDetector.template("https://example.com/cal/2024/05?b=2&a=1") == "example.com/cal/{n}/{n}?a&b"
+    assert TrapDetector.template("https://example.com/item/5f2b9c1a3e/") == "example.com/item/{id}/"
+
+
+def test_template_budget():
+    traps = TrapDetector(budget=3)
+    urls = [f"https://example.com/calendar/{day}" for day in range(5)]
+    assert [traps.allow(url) for url in urls] == [True, True, True, False, False]
+    assert traps.rejected["template-budget"] == 2
+    assert traps.allow("https://example.com/about")
+
+
+def test_resumed_urls_count_against_budget():
+    traps = TrapDetector(budget=2)
+    traps.add(["https://example.com/p/1", "https://example.com/p/2"])
+    assert not traps.allow("https://example.com/p/3")
+
+
+def test_structural_traps():
+    traps = TrapDetector(max_length=60, max_depth=5, max_repeats=2)
+    assert traps.check("https://example.com/" + "x" * 60) == "url-length"
+    assert traps.check("https://example.com/a/b/c/d/e/f") == "path-depth"
+    assert traps.check("https://example.com/a/x/a/y/a") == "repeating-segments"
+    assert TrapDetector().check("https://example.com/s/a/b/a/b/a/b") == "repeating-segments"
+    assert traps.check("https://example.com/a/b/c") is None